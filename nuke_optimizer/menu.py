@@ -1,10 +1,18 @@
 """Nuke menu integration for the Optimizer tool."""
 
+# Set by register() so repeated calls do not re-add the menu entries.
+_REGISTERED = False
+
+# Optimizer submenu handle, cached by _ensure_menu().
+_OPTIMIZER_MENU = None
+
+
 def _ensure_menu(nuke):
     """Return the Optimizer submenu attached to Nuke's Scripts menu.
 
     Ensures that the 'Scripts/Optimizer' submenu exists and returns it so
-    Optimizer-related commands can be registered under it.
+    Optimizer-related commands can be registered under it. The handle is
+    cached after the first lookup.
 
     Args:
         nuke: Nuke module used to access and manipulate menus.
@@ -12,29 +20,36 @@ def _ensure_menu(nuke):
     Returns:
         The Optimizer submenu under the Scripts menu.
     """
-    return nuke.menu("Nuke").addMenu("Scripts").addMenu("Optimizer")
+    global _OPTIMIZER_MENU
+    if _OPTIMIZER_MENU is None:
+        _OPTIMIZER_MENU = nuke.menu("Nuke").addMenu("Scripts").addMenu("Optimizer")
+    return _OPTIMIZER_MENU
 
 
 def _add_optimizer_entries(menu):
     """Register Optimizer commands under the given Nuke menu.
 
     Adds menu entries to launch the Optimizer UI and to enable, disable,
-    or toggle heavy nodes using the user's saved configuration.
+    or toggle heavy nodes using the user's saved configuration. Commands
+    are registered as functions of ``optimizer.menu_actions``, so Nuke
+    does not compile a source string on every invocation and nothing is
+    looked up in the shared ``__main__`` namespace.
 
     Args:
         menu: Nuke menu object under which Optimizer commands are added.
     """
+    from optimizer import menu_actions
+
     menu.addCommand(
         "Toggle heavy nodes",
-        "from mvc import app; from optimizer import nuke_services; "
-        "app.ensure_logging(); nuke_services.toggle_heavy_nodes()",
+        menu_actions.toggle_heavy_nodes,
         shortcut="Ctrl+Alt+O",
         tooltip="Toggle disable on all heavy nodes selected in Optimizer.",
     )
 
     menu.addCommand(
         "Optimizer editor",
-        "from mvc import app; app.show()",
+        menu_actions.show_editor,
         tooltip=(
             "Open the Optimizer window to choose which node classes are "
             "treated as heavy node classes."
@@ -47,30 +62,47 @@ def _add_optimizer_entries(menu):
 
     menu.addCommand(
         "Disable Heavy Nodes",
-        "from mvc import app; from optimizer import nuke_services; "
-        "app.ensure_logging(); nuke_services.heavy_nodes(toggle=False)",
+        menu_actions.disable_heavy_nodes,
         tooltip="Disable all heavy nodes currently marked as heavy.",
     )
 
     menu.addCommand(
         "Enable Heavy Nodes",
-        "from mvc import app; from optimizer import nuke_services; "
-        "app.ensure_logging(); nuke_services.heavy_nodes(toggle=True)",
+        menu_actions.enable_heavy_nodes,
         tooltip="Enable all heavy nodes currently marked as heavy.",
     )
 
 
-def main():
-    """Create or refresh the Optimizer entries in the Nuke menu.
+def register():
+    """Create the Optimizer entries in the Nuke menu once per session.
 
-    Ensures that the Scripts menu exists and (re)adds the Optimizer
-    commands under the Optimizer submenu. Safe to call multiple times
-    in a session.
+    Ensures that the Scripts menu exists and adds the Optimizer commands
+    under the Optimizer submenu. A module-level flag makes repeated calls
+    a no-op, so re-sourcing the menu does not walk Nuke's menus again.
     """
+    global _REGISTERED
+    if _REGISTERED:
+        return
+
     import nuke
 
     menu = _ensure_menu(nuke)
     _add_optimizer_entries(menu)
+    _REGISTERED = True
+
+
+def main():
+    """Create the Optimizer entries in the Nuke menu for GUI sessions.
+
+    Kept as the script entry point; delegates to :func:`register`.
+    Headless sessions (``nuke -t`` / ``nuke -x`` renders) never show the
+    menu, so registration is skipped there entirely.
+    """
+    import nuke
+
+    if not getattr(nuke, "GUI", True):
+        return
+    register()
 
 
 if __name__ == "__main__":
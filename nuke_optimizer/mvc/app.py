@@ -9,10 +9,9 @@ The UI is intentionally managed as a *single instance* per Nuke session.
 This avoids duplicate panels and keeps the interaction simple.
 """
 
+import functools
 import logging
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
-from typing import Optional
+import os
 
 
 log = logging.getLogger(__name__)
@@ -21,87 +20,138 @@ log = logging.getLogger(__name__)
 # Single-instance window handle.
 #
 # The controller and model are created on-demand in :func:`show` and are
-# intentionally not stored globally. Only the view is cached so we can reuse
-# the same window and preserve its Qt state.
+# intentionally not stored globally (the view owns the controller). Only the
+# view is cached so we can reuse the same window and preserve its Qt state.
+# The handle is cleared when Qt destroys the window after it is closed.
 VIEW = None  # type: ignore[assignment]
-LOG_DIR = Path.home() / ".nuke"
-LOG_FILE = LOG_DIR / "optimizer.log"
+
+# Log location as plain strings (avoids importing pathlib at startup).
+_HOME = os.path.expanduser("~")
+LOG_DIR = os.path.join(_HOME, ".nuke")
+LOG_FILE = os.path.join(LOG_DIR, "optimizer.log")
 LOG_LEVEL = logging.INFO
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s %(levelname)s:%(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Set once the file handler is in place so repeated menu/hotkey calls to
+# ensure_logging() return immediately.
+_LOGGING_READY = False
+
+# Name of the queue handler attached to the package loggers, and the listener
+# thread that drains its queue into the rotating log file.
+_HANDLER_NAME = "nuke_optimizer.file"
+_LISTENER = None
+
+
+# Package loggers whose records are written to optimizer.log.
+_NAMESPACES = ("optimizer", "mvc")
+
+
+def _logging_disabled() -> bool:
+    """Return True when file logging should be skipped for this session.
+
+    Setting ``NUKE_OPTIMIZER_DISABLE_LOG`` to ``1``, ``true``, ``yes`` or
+    ``on`` (case-insensitive) opts out explicitly; other values such as
+    ``0`` or ``false`` leave logging on. Headless sessions (``nuke -t`` /
+    ``nuke -x``, render farm nodes) skip file logging automatically.
+    """
+    flag = os.environ.get("NUKE_OPTIMIZER_DISABLE_LOG", "").strip().lower()
+    if flag in {"1", "true", "yes", "on"}:
+        return True
+    try:
+        import nuke  # type: ignore
+    except ImportError:
+        return False
+    return not getattr(nuke, "GUI", True)
 
 
 def _configure_logging() -> None:
     """Configure logging for the Optimizer.
 
     Writes log records to ~/.nuke/optimizer.log using a rotating file handler.
-    The handler is attached to the *root logger* so logs from both `optimizer.*`
-    and `mvc.*` are captured (with a namespace filter to keep the log focused).
+    Records are handed to a :class:`~logging.handlers.QueueHandler` attached
+    directly to the `optimizer` and `mvc` package loggers, which stop
+    propagating to root, so only this tool's records are captured and each
+    record is handled once. A background
+    :class:`~logging.handlers.QueueListener` owns the rotating file handler,
+    keeping file I/O off Nuke's UI thread.
     """
+    global _LOGGING_READY, _LISTENER
+    if _LOGGING_READY:
+        return
 
-    root_logger = logging.getLogger()
-    package_logger = logging.getLogger("optimizer")
+    if _logging_disabled():
+        _LOGGING_READY = True
+        return
 
-    # Ensure our package logger emits INFO+ (even if root is more permissive)
-    package_logger.setLevel(LOG_LEVEL)
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-    def _find_rotating_file_handler(logger_obj: logging.Logger) -> Optional[RotatingFileHandler]:
-        """Return the Optimizer rotating file handler if it is already attached."""
-        for handler in logger_obj.handlers:
-            if isinstance(handler, RotatingFileHandler) and getattr(
-                handler, "baseFilename", None
-            ) == str(LOG_FILE):
-                return handler
-        return None
+    root_logger = logging.getLogger()
+    package_loggers = [logging.getLogger(name) for name in _NAMESPACES]
+
+    # If the package loggers already have the handler, we're done.
+    if all(
+        any(
+            isinstance(handler, QueueHandler) and handler.get_name() == _HANDLER_NAME
+            for handler in logger_obj.handlers
+        )
+        for logger_obj in package_loggers
+    ):
+        _LOGGING_READY = True
+        return
 
-    # If root already has the handler, we're done.
-    if _find_rotating_file_handler(root_logger) is not None:
+    # Older sessions attached handlers to root or wrote to the file
+    # directly; the listener below owns the file from now on.
+    for logger_obj in [root_logger, *package_loggers]:
+        for handler in list(logger_obj.handlers):
+            if isinstance(handler, QueueHandler) and handler.get_name() == _HANDLER_NAME:
+                logger_obj.removeHandler(handler)
+            elif isinstance(handler, RotatingFileHandler) and getattr(
+                handler, "baseFilename", None
+            ) == LOG_FILE:
+                logger_obj.removeHandler(handler)
+                handler.close()
+
+    try:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        file_handler = RotatingFileHandler(
+            LOG_FILE,
+            maxBytes=1_000_000,
+            backupCount=5,
+            encoding="utf-8",
+        )
+    except OSError as exc:
+        log.warning(
+            "Unable to configure Optimizer file logging at %s: %s",
+            LOG_FILE,
+            exc,
+        )
         return
 
-    # If an older session already attached it to the package logger, migrate it to root.
-    handler = _find_rotating_file_handler(package_logger)
-    if handler is not None:
-        package_logger.removeHandler(handler)
-    else:
-        try:
-            LOG_DIR.mkdir(parents=True, exist_ok=True)
-            handler = RotatingFileHandler(
-                LOG_FILE,
-                maxBytes=1_000_000,
-                backupCount=5,
-                encoding="utf-8",
-            )
-        except OSError as exc:
-            log.warning(
-                "Unable to configure Optimizer file logging at %s: %s",
-                LOG_FILE,
-                exc,
-            )
-            return
-
-    formatter = logging.Formatter(
-        fmt="%(asctime)s %(levelname)s:%(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    handler.setFormatter(formatter)
-    handler.setLevel(LOG_LEVEL)
-
-    # Keep the log focused on this tool (captures both optimizer.* and mvc.*)
-    class _NamespaceFilter(logging.Filter):
-        def filter(self, record: logging.LogRecord) -> bool:
-            name = record.name or ""
-            return name == "optimizer" or name.startswith("optimizer.") or name == "mvc" or name.startswith("mvc.")
-
-    # Avoid stacking filters if handler was migrated/reused
-    handler.filters = []
-    handler.addFilter(_NamespaceFilter())
-
-    root_logger.addHandler(handler)
-
-    # Ensure INFO logs aren't dropped by a stricter root level.
-    if root_logger.level > LOG_LEVEL:
-        root_logger.setLevel(LOG_LEVEL)
-
-    # Let optimizer.* bubble to root (default True, but keep it explicit)
-    package_logger.propagate = True
+    file_handler.setFormatter(_FORMATTER)
+    file_handler.setLevel(LOG_LEVEL)
+
+    record_queue = queue.SimpleQueue()
+    _LISTENER = QueueListener(record_queue, file_handler, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(_LISTENER.stop)
+
+    queue_handler = QueueHandler(record_queue)
+    queue_handler.set_name(_HANDLER_NAME)
+    queue_handler.setLevel(LOG_LEVEL)
+
+    for logger_obj in package_loggers:
+        # Emit INFO+ regardless of the root level, and stop records from
+        # also walking the root handler chain.
+        logger_obj.setLevel(LOG_LEVEL)
+        logger_obj.addHandler(queue_handler)
+        logger_obj.propagate = False
+
+    _LOGGING_READY = True
 
 
 def show() -> None:
@@ -136,6 +186,7 @@ def show() -> None:
     # Build MVC (order matters)
     # Local imports keep this module importable without immediately pulling in UI deps.
     from mvc import view, model, controller  # type: ignore
+    from mvc.qt_compat import WA_DELETE_ON_CLOSE
 
     # Model: authoritative list state (no Qt deps)
     model_instance = model.Model()
@@ -143,8 +194,19 @@ def show() -> None:
     # View: passive UI (widgets + layout)
     view_instance = view.View()
 
-    # Controller: wires view<->model and handles persistence/behavior
-    controller.Controller(view_instance, model_instance)
+    # Controller: wires view<->model and handles persistence/behavior.
+    # Signals are connected to bound methods, which Qt does not keep alive,
+    # so the view holds the controller for as long as the window exists.
+    view_instance.controller = controller.Controller(view_instance, model_instance)
+
+    # Let Qt delete the widget tree once the window is closed (after the
+    # controller has flushed state on `closed`), and drop our handle then.
+    # A weakref alone would not work: nothing else owns this top-level
+    # widget, so it would be collected as soon as show() returned.
+    view_instance.setAttribute(WA_DELETE_ON_CLOSE)
+    # The handler is bound to this instance: a stale window's deferred
+    # delete can arrive after a new one has been cached.
+    view_instance.destroyed.connect(functools.partial(_forget_view, view_instance))
 
     # Cache the view for single-instance reuse and present it
     VIEW = view_instance
@@ -152,6 +214,16 @@ def show() -> None:
     view_instance.raise_()
 
 
+def _forget_view(view_instance, *_args) -> None:
+    """Drop the cached window handle once Qt has destroyed ``view_instance``.
+
+    The handle is left alone if it already points at a newer window.
+    """
+    global VIEW
+    if VIEW is view_instance:
+        VIEW = None
+
+
 def ensure_logging() -> None:
     """Ensure logging is configured for the Optimizer package.
 
@@ -9,21 +9,37 @@ The controller coordinates three pieces:
 
 from __future__ import annotations
 
+import contextlib
+import csv
+import io
+import itertools
+import json
 import logging
-from typing import List, Optional, Set, Tuple
+import time
+from typing import Callable, Iterator, List, Optional, Sequence, Set, Tuple
 
 # Qt binding compatibility (PySide2 / PySide6).
-from mvc.qt_compat import QtWidgets, QtCore, CHECKED, PARTIALLY_CHECKED
+from mvc.qt_compat import QtWidgets, QtCore, CHECKED, UNCHECKED, PARTIALLY_CHECKED
 
-from optimizer import storage, config, defaults
+from optimizer import storage, config, defaults, nuke_services
 from optimizer.text_utils import unique_stripped_strings
 from mvc.dialogs import DialogService
 
 
 log = logging.getLogger(__name__)
 
+# Pending-work bits for the controller's shared debounce timer.
+DIRTY_SAVE = 1
+DIRTY_REFRESH = 2
+DIRTY_FILTER = 4
 
-def _make_config_mapping(classes: List[str], toggled: List[str]) -> dict:
+# Integer values of the check states, for comparing the raw int emitted by
+# QCheckBox.stateChanged. PySide6 enums are not ints, so go through `.value`.
+_CHECKED_INT = int(getattr(CHECKED, "value", CHECKED))
+_PARTIAL_INT = int(getattr(PARTIALLY_CHECKED, "value", PARTIALLY_CHECKED))
+
+
+def _make_config_mapping(classes: Sequence[str], toggled: Sequence[str]) -> dict:
     """Build a config dict ready to be saved/exported."""
     return {
         "version": config.CONFIG_VERSION,
@@ -32,6 +48,117 @@ def _make_config_mapping(classes: List[str], toggled: List[str]) -> dict:
     }
 
 
+class _PersistWorker(QtCore.QObject):
+    """Write config payloads with ``storage.save`` on a background thread.
+
+    Only the most recent submitted payload is kept: a payload that has not
+    been written yet is replaced by the next one, so bursts of saves
+    collapse into a single write. :meth:`run_loop` runs on the worker's
+    QThread until nothing is pending and then quits that thread, so no
+    thread is left running while the panel is idle; :meth:`submit` tells
+    the caller when the thread has to be started again.
+    """
+
+    # (ok, error message) after each write attempt.
+    saved = QtCore.Signal(bool, str)
+
+    def __init__(self):
+        """Create an idle worker with nothing pending."""
+        super().__init__()
+        self._mutex = QtCore.QMutex()
+        self._idle = QtCore.QWaitCondition()
+        self._pending: Optional[dict] = None
+        self._busy = False
+        self._running = False
+        # (ok, error message) of the most recent write attempt.
+        self._last_result: Tuple[bool, str] = (True, "")
+
+    def submit(self, payload: dict) -> bool:
+        """Queue ``payload`` for writing, replacing any unwritten payload.
+
+        Returns:
+            bool: True if :meth:`run_loop` is not running and the caller
+            must start the worker's thread.
+        """
+        self._mutex.lock()
+        try:
+            self._pending = payload
+            if self._running:
+                return False
+            self._running = True
+            return True
+        finally:
+            self._mutex.unlock()
+
+    def flush(self) -> Tuple[bool, str]:
+        """Block until every submitted payload has been written.
+
+        Returns:
+            Tuple[bool, str]: ``(ok, error message)`` of the last write.
+        """
+        self._mutex.lock()
+        try:
+            while self._pending is not None or self._busy:
+                self._idle.wait(self._mutex)
+            return self._last_result
+        finally:
+            self._mutex.unlock()
+
+    def run_loop(self) -> None:
+        """Write pending payloads, then quit the current thread."""
+        while True:
+            self._mutex.lock()
+            try:
+                if self._pending is None:
+                    self._running = False
+                    QtCore.QThread.currentThread().quit()
+                    return
+                payload, self._pending = self._pending, None
+                self._busy = True
+            finally:
+                self._mutex.unlock()
+
+            # Any failure is reported instead of escaping: an exception
+            # leaving this loop would end it with _running still set, and
+            # later saves would never be written.
+            try:
+                storage.save(payload)
+            except OSError as e:
+                log.warning("Could not write Optimizer config: %s", e)
+                result = (False, str(e))
+            except Exception as e:
+                log.exception("Unexpected error writing Optimizer config: %s", e)
+                result = (False, str(e))
+            else:
+                result = (True, "")
+
+            self._mutex.lock()
+            self._last_result = result
+            self._busy = False
+            self._idle.wakeAll()
+            self._mutex.unlock()
+            self.saved.emit(*result)
+
+
+class _Relay(QtCore.QObject):
+    """Main-thread receiver that forwards a ``(bool, str)`` signal to a callable.
+
+    PySide calls plain Python callables in the emitting thread; routing
+    through a QObject that lives on the UI thread makes the connection
+    queued, so the callback can safely touch widgets.
+    """
+
+    def __init__(self, callback: Callable[[bool, str], None], parent=None):
+        """Create a relay that calls ``callback`` for every received signal."""
+        super().__init__(parent)
+        self._callback = callback
+
+    @QtCore.Slot(bool, str)
+    def relay(self, ok: bool, message: str) -> None:
+        """Forward the signal arguments to the callback."""
+        self._callback(ok, message)
+
+
 class Controller:
     """Application controller.
 
@@ -63,14 +190,33 @@ class Controller:
         self.model = model
         self.dialogs = DialogService()
 
-        self._refresh_timer = QtCore.QTimer(self.view)
-        self._refresh_timer.setSingleShot(True)
-        self._refresh_timer.timeout.connect(self._refresh_counts_now)
-
-        self._save_timer = QtCore.QTimer(self.view)
-        self._save_timer.setSingleShot(True)
-        self._save_timer.timeout.connect(self._persist_state)
-        self._save_delay_ms = 400
+        # One debounce timer serves both saves and count refreshes. `_due`
+        # maps each pending DIRTY_* bit to its time.monotonic() deadline and
+        # the timer is armed for the earliest one.
+        self._due: dict = {}
+        # Nesting depth of _bulk() blocks; the timer is not armed inside one.
+        self._bulk_depth = 0
+        self._dirty_timer = QtCore.QTimer(self.view)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.timeout.connect(self._flush_dirty)
+
+        # Adaptive save debounce: the delay grows while edits keep needing a
+        # new write soon after the previous one went out, and drops back to
+        # the minimum once no write has gone out for longer than the maximum.
+        self._min_save_ms = 400
+        self._max_save_ms = 2000
+        self._save_inc_ms = 400
+        self._cur_save_ms = self._min_save_ms
+        # time.monotonic() of the last write handed to the persist worker.
+        self._last_write_ts = 0.0
+
+        # Hash of the (classes, toggled) pair last written to disk; a save
+        # with an identical payload is skipped. None forces the next write.
+        self._last_saved_hash: Optional[int] = None
+
+        # Checked class names as last read from the view; None until the
+        # next read. Cleared by every handler that changes rows or checks.
+        self._enabled_cache: Optional[frozenset] = None
 
         # Initialize state from storage (or defaults) and paint the UI.
         self._bootstrap()
@@ -78,9 +224,25 @@ class Controller:
         # Wire raw widget signals from the passive view to controller handlers.
         self._connect_view_signals()
 
-        # Ensure any pending changes are flushed when the panel closes.
+        # Config writes run on a worker thread so disk latency never stalls
+        # the panel. The thread only runs while payloads are pending and is
+        # joined when the panel closes (see _flush_on_close). It has no
+        # parent: as a child of the view, ~QWidget would delete it.
+        self._persist_worker = _PersistWorker()
+        self._persist_thread = QtCore.QThread()
+        self._persist_worker.moveToThread(self._persist_thread)
+        self._persist_thread.started.connect(self._persist_worker.run_loop)
+        self._persist_relay = _Relay(self._on_persist_saved, self.view)
+        self._persist_worker.saved.connect(self._persist_relay.relay)
+        # A write started by a handler may still be running if the
+        # application quits with the panel open.
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._persist_thread.wait)
+
+        # Ensure any pending changes are written when the panel closes.
         if hasattr(self.view, "closed"):
-            self.view.closed.connect(self._persist_state)
+            self.view.closed.connect(self._flush_on_close)
 
         self._schedule_refresh()
 
@@ -107,6 +269,66 @@ class Controller:
     # Timers / debounced operations
     # -----------------------------------------------------------------------------
 
+    def _mark_dirty(self, flag: int, delay_ms: int, *, postpone: bool = False) -> None:
+        """Record pending work and (re)arm the shared debounce timer.
+
+        By default a later request never postpones an earlier deadline for
+        the same flag; ``postpone=True`` moves it to ``delay_ms`` from now
+        (trailing debounce).
+
+        Args:
+            flag: One ``DIRTY_*`` bit to add to the pending set.
+            delay_ms: Delay in milliseconds before the work should run.
+            postpone: Replace an existing deadline for ``flag`` even if it
+                is earlier.
+        """
+        now = time.monotonic()
+        due = now + delay_ms / 1000.0
+        current = self._due.get(flag)
+        if current is None or postpone or due < current:
+            self._due[flag] = due
+        if not self._bulk_depth:
+            self._arm_dirty_timer(now)
+
+    def _arm_dirty_timer(self, now: float) -> None:
+        """Start the shared timer for the earliest pending deadline, if any."""
+        if not self._due:
+            self._dirty_timer.stop()
+            return
+        wait_ms = int((min(self._due.values()) - now) * 1000)
+        self._dirty_timer.start(max(0, wait_ms))
+
+    def _flush_dirty(self) -> None:
+        """Run debounced work that is due: persist, refresh counts, then filter."""
+        # Coarse Qt timers may fire a few milliseconds early.
+        cutoff = time.monotonic() + 0.005
+        ready = [flag for flag, due in self._due.items() if due <= cutoff]
+        for flag in ready:
+            del self._due[flag]
+
+        # Each job runs on its own, so one failing (e.g. a Nuke API error
+        # during the refresh) neither drops the others nor leaves later
+        # deadlines without an armed timer.
+        jobs = (
+            (DIRTY_SAVE, "saving the configuration", self._persist_state),
+            (DIRTY_REFRESH, "refreshing the node counts", self._refresh_counts_now),
+            (DIRTY_FILTER, "filtering the class list", self._apply_filter_now),
+        )
+        try:
+            for flag, context, job in jobs:
+                if flag not in ready:
+                    continue
+                try:
+                    job()
+                except Exception as exc:
+                    log.exception("Debounced work failed while %s: %s", context, exc)
+        finally:
+            self._arm_dirty_timer(time.monotonic())
+
+    def _apply_filter_now(self) -> None:
+        """Apply the current filter text to the class list."""
+        self.view.apply_filter(self.view.filter_edit.text())
+
     def _schedule_refresh(self, delay_ms: int = 150) -> None:
         """Schedule a debounced refresh of the heavy-node counts.
 
@@ -115,30 +337,50 @@ class Controller:
                 refresh. Multiple calls within this window coalesce into a single
                 refresh to avoid redundant Nuke API calls.
         """
-        # Coalesce multiple calls into one refresh.
-        self._refresh_timer.start(delay_ms)
+        self._mark_dirty(DIRTY_REFRESH, delay_ms)
+
+    def _schedule_filter(self, *_args, delay_ms: int = 100) -> None:
+        """Debounce the class filter so it runs once typing pauses.
+
+        Args:
+            delay_ms: Quiet period in milliseconds after the last keystroke
+                before the filter text is applied to the list.
+        """
+        self._mark_dirty(DIRTY_FILTER, delay_ms, postpone=True)
 
     def _schedule_persist_state(self, delay_ms: Optional[int] = None) -> None:
         """Schedule a debounced write of the current configuration.
 
+        Each call pushes the pending write back, so a burst of edits always
+        collapses into one write. Without an explicit delay the adaptive
+        interval is used: if a write went out less than ``_max_save_ms``
+        ago, editing is ongoing and the interval grows by
+        ``_save_inc_ms`` (up to ``_max_save_ms``); otherwise it resets to
+        ``_min_save_ms``.
+
         Args:
             delay_ms: Optional delay in milliseconds before writing the
-                configuration. If ``None``, a default save delay is used.
-                Multiple calls within this window are coalesced into a
-                single disk write.
+                configuration. If ``None``, the adaptive delay is used.
         """
         if delay_ms is None:
-            delay_ms = self._save_delay_ms
-        self._save_timer.start(delay_ms)
+            if time.monotonic() - self._last_write_ts < self._max_save_ms / 1000.0:
+                self._cur_save_ms = min(
+                    self._max_save_ms, self._cur_save_ms + self._save_inc_ms
+                )
+            else:
+                self._cur_save_ms = self._min_save_ms
+            delay_ms = self._cur_save_ms
+        self._mark_dirty(DIRTY_SAVE, delay_ms, postpone=True)
 
     def _refresh_counts_now(self) -> None:
         """Query Nuke for current per-class statistics and update the view.
 
         Calls `optimizer.nuke_services.class_stats()` with the model's class
         list and passes the resulting statistics to `view.set_counts()`.
+        Nuke is queried every time: disable states and nodes can change
+        outside the panel (menu hotkeys, manual edits, Group contents)
+        without any cheap signal, so cached counts could go stale.
         """
-        from optimizer import nuke_services
-
         classes = self.model.as_list()
         stats = nuke_services.class_stats(classes)
         self.view.set_counts(stats)
@@ -152,26 +394,20 @@ class Controller:
 
         Reads configuration using `optimizer.storage.safe_load_or_default()`,
         falling back to `optimizer.defaults.RENDER_INTENSIVE_NODES` when
-        needed. Populates the model, rebuilds the list in the view, reapplies
-        stored toggles, syncs the Select-all tri-state, and schedules an
-        initial counts refresh.
+        needed. Populates the model, rebuilds the list in the view with the
+        stored toggles already applied, and schedules an initial counts
+        refresh.
         """
         data = storage.safe_load_or_default()
         classes = data.get("classes", list(defaults.RENDER_INTENSIVE_NODES))
         toggled_list = data.get("toggled", [])
 
         # Seed the authoritative list (order + membership).
-        self.model.replace_all(classes)
-
-        # Paint the list: start unchecked, then enable only persisted toggles.
-        self.view.set_items(self.model.as_list(), checked=False)
-        toggled_set = set(toggled_list)
-        for name in self.model.as_list():
-            if name in toggled_set:
-                self.view.set_item_checked(name, True)
+        self.model.replace_all(classes, trusted=True)
 
-        # Keep tri-state (Unchecked/Partially/Checked) truthful.
-        self.view.sync_select_all_from_items()
+        # Paint the list in one pass, with persisted toggles already checked.
+        # set_items also keeps the tri-state (Unchecked/Partially/Checked) truthful.
+        self.view.set_items(self.model.as_list(), checked=frozenset(toggled_list))
         self._schedule_refresh()
 
     def _connect_view_signals(self) -> None:
@@ -182,28 +418,45 @@ class Controller:
         user actions are reflected in the model, persisted, and applied
         to the Nuke scene when needed.
         """
-        self.view.filter_edit.textChanged.connect(
-            lambda text: self.view.apply_filter(text)
-        )
-        self.view.btn_toggle_heavy.clicked.connect(lambda: self._on_toggle_heavy())
-        self.view.btn_add.clicked.connect(lambda: self._on_add_clicked())
-        self.view.btn_remove.clicked.connect(lambda: self._on_remove_clicked())
+        self.view.filter_edit.textChanged.connect(self._schedule_filter)
+        self.view.btn_toggle_heavy.clicked.connect(self._on_toggle_heavy)
+        self.view.btn_add.clicked.connect(self._on_add_clicked)
+        self.view.btn_remove.clicked.connect(self._on_remove_clicked)
         # export/import presets
-        self.view.btn_export.clicked.connect(lambda: self._on_export_clicked())
-        self.view.btn_import.clicked.connect(lambda: self._on_import_clicked())
+        self.view.btn_export.clicked.connect(self._on_export_clicked)
+        self.view.btn_import.clicked.connect(self._on_import_clicked)
 
-        self.view.btn_defaults.clicked.connect(
-            lambda: self._on_reset_defaults_clicked()
-        )
+        self.view.btn_defaults.clicked.connect(self._on_reset_defaults_clicked)
 
         # Tri-state 'Select all' checkbox and per-item checkbox changes.
         self.view.chk_select_all.stateChanged.connect(
-            lambda state: self._on_select_all_state_changed(state)
+            self._on_select_all_state_changed
         )
 
-        self.view.list_widget.itemChanged.connect(lambda item: self._on_item_changed(item))
+        self.view.list_widget.itemChanged.connect(self._on_item_changed)
+
+        self.view.list_widget.model().rowsMoved.connect(self._on_list_reordered)
 
-        self.view.list_widget.model().rowsMoved.connect(lambda *args: self._on_list_reordered())
+    @contextlib.contextmanager
+    def _bulk(self) -> Iterator[None]:
+        """Group a bulk update so it triggers no per-row work.
+
+        While inside the block, this controller's ``itemChanged`` slot is
+        disconnected (other listeners and the list's own signals keep
+        working) and debounced work is only recorded; the shared timer is
+        armed once when the outermost block exits.
+        """
+        signal = self.view.list_widget.itemChanged
+        if self._bulk_depth == 0:
+            signal.disconnect(self._on_item_changed)
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                signal.connect(self._on_item_changed)
+                self._arm_dirty_timer(time.monotonic())
 
     # -----------------------------------------------------------------------------
     # Handlers: view -> controller
@@ -215,8 +468,15 @@ class Controller:
         Uses `optimizer.nuke_services.toggle_heavy_nodes()` to apply the
         operation, shows a summarized result to the user in a dialog, and
         schedules a refresh of the heavy-node counts in the UI.
+
+        The services read the toggled classes from the config on disk, so
+        any debounced save still pending is written (and waited for)
+        first; otherwise the action could use checkboxes from before the
+        latest edit.
         """
-        from optimizer import nuke_services
+        if not self._persist_state(wait=True):
+            # The write error is reported by _on_persist_saved.
+            return
 
         toggle_result = nuke_services.toggle_heavy_nodes()
 
@@ -248,12 +508,10 @@ class Controller:
 
         Uses optimizer.nuke_services.selected_class_names() to discover
         class names from the current selection, prompts the user for
-        confirmation, adds any valid new classes to the model and view,
-        persists the updated configuration, and shows a brief status
-        message.
+        confirmation, adds any valid new classes to the model and view in
+        one batch, reports skipped names in a single warning, persists the
+        updated configuration, and shows a brief status message.
         """
-        from optimizer import nuke_services
-
         classes = nuke_services.selected_class_names()
         if not classes:
             self.dialogs.warn(self.view, "No nodes selected", "Select one or more nodes.")
@@ -268,30 +526,35 @@ class Controller:
         ):
             return
 
-        any_added = False
-        added_count = 0
+        added, skipped = self.model.add_classes(classes)
+        if added:
+            with self._bulk():
+                self.view.add_items(added, checked=True)
+                self._invalidate_view_caches()
 
-        for name in classes:
-            added_successfully, error = self.model.add_class(name)
-            if added_successfully:
-                self.view.add_item(name, checked=True)
-                any_added, added_count = True, added_count + 1
-            else:
+        if skipped:
+            # One dialog for every skipped name instead of one per name.
+            errors = {error for _name, error in skipped}
+            if len(errors) == 1:
                 title = {
                     "exists": "Duplicate class",
                     "empty": "No class name",
                     "type": "Invalid class",
-                }.get(error, "Couldn't add class")
-                self.dialogs.warn(self.view, title, f"Skipped '{name}': {error}")
+                }.get(next(iter(errors)), "Couldn't add class")
+            else:
+                title = "Some classes were skipped"
+            lines = "\n".join(f"Skipped '{name}': {error}" for name, error in skipped)
+            self.dialogs.warn(self.view, title, lines)
 
-        if any_added:
-            if self._persist_state():
-                self._schedule_refresh()
-                self.view.show_status(
-                    f"Added {added_count} class{'es' if added_count != 1 else ''}.",
-                    kind="success",
-                    timeout_ms=2500,
-                )
+        added_count = len(added)
+        if added:
+            self._persist_state()
+            self._schedule_refresh()
+            self.view.show_status(
+                f"Added {added_count} class{'es' if added_count != 1 else ''}.",
+                kind="success",
+                timeout_ms=2500,
+            )
         else:
             self.view.show_status("No classes added.", kind="info", timeout_ms=2000)
 
@@ -319,26 +582,32 @@ class Controller:
             return
         removed = int(result.get("removed", 0))
         self.view.remove_selected()
-        if self._persist_state():
-            self._schedule_refresh()
-            self.view.show_status(
-                f"Removed {removed} {'class' if removed == 1 else 'classes'}.",
-                kind="warn",
-                timeout_ms=2500,
-            )
+        self._invalidate_view_caches()
+        self._persist_state()
+        self._schedule_refresh()
+        self.view.show_status(
+            f"Removed {removed} {'class' if removed == 1 else 'classes'}.",
+            kind="warn",
+            timeout_ms=2500,
+        )
 
     def _on_item_changed(self, item) -> None:
         """Update aggregate state and persistence when a row checkbox changes.
 
         Keeps the Select-all tri-state checkbox in sync with individual
         row check states, schedules a debounced configuration write, and
-        schedules a counts refresh.
+        schedules a counts refresh. Notifications that did not change the
+        row's checkbox are ignored.
 
         Args:
             item: The `QtWidgets.QListWidgetItem` whose checkbox state has
                 just changed.
         """
         try:
+            if not self.view.note_item_check_changed(item):
+                return
+            self._invalidate_view_caches()
+
             # Update tri-state (Unchecked / PartiallyChecked / Checked).
             self.view.sync_select_all_from_items()
 
@@ -359,37 +628,32 @@ class Controller:
 
         After applying the state, the method resynchronizes the tri-state
         checkbox, schedules a debounced configuration write, and
-        schedules a counts refresh.
+        schedules a counts refresh. If every row already had the requested
+        state, only the checkbox is resynchronized.
 
         Args:
             state: Integer check state value emitted by the tri-state
                 Select-all checkbox.
         """
         try:
-            # Convert the raw int state to the correct enum type for the active Qt binding.
-            try:
-                state_enum = QtCore.Qt.CheckState(state)
-            except Exception:
-                state_enum = state
-
-            if state_enum == PARTIALLY_CHECKED:
+            # Map the raw int state straight to a check-state enum; a
+            # partial state means 'check all'.
+            if state == _CHECKED_INT or state == _PARTIAL_INT:
                 state_enum = CHECKED
-
-            # Prevent storms of itemChanged signals during bulk updates.
-            blocker = QtCore.QSignalBlocker(self.view.list_widget)
-            try:
-                for i in range(self.view.list_widget.count()):
-                    item = self.view.list_widget.item(i)
-                    if item is None:
-                        continue
-                    item.setCheckState(state_enum)
-            finally:
-                del blocker
-
-            # Reflect aggregate state and persist new toggled subset.
-            self.view.sync_select_all_from_items()
-            self._schedule_persist_state()
-            self._schedule_refresh()
+            else:
+                state_enum = UNCHECKED
+
+            # One batched model update instead of per-row itemChanged storms.
+            with self._bulk():
+                changed = self.view.set_all_checked(state_enum)
+
+                # Reflect aggregate state and persist new toggled subset.
+                self.view.sync_select_all_from_items()
+                if not changed:
+                    return
+                self._invalidate_view_caches()
+                self._schedule_persist_state()
+                self._schedule_refresh()
 
         except Exception as exc:
             # Catch any Qt/logic errors so they don't escape the slot.
@@ -410,25 +674,24 @@ class Controller:
         lower = path.lower()
         fmt = "csv" if lower.endswith(".csv") else "json"
 
-        classes = list(self.model.as_list())
-        enabled_set = set(self.view.get_enabled_names())
-        toggled_list = [name for name in classes if name in enabled_set]
+        classes = self.model.as_list()
+        toggled_list = self._ordered_enabled(classes)
+        enabled_set = set(toggled_list)
 
         try:
             if fmt == "csv":
-                import csv
-
-                with open(path, "w", newline="", encoding="utf-8") as fh:
-                    writer = csv.writer(fh)
-                    writer.writerow(["class", "toggled"])
-                    for name in classes:
-                        writer.writerow([name, "1" if name in enabled_set else "0"])
+                buffer = io.StringIO(newline="")
+                writer = csv.writer(buffer)
+                writer.writerow(["class", "toggled"])
+                for name in classes:
+                    writer.writerow([name, "1" if name in enabled_set else "0"])
+                payload = buffer.getvalue().encode("utf-8")
             else:
-                import json
-
-                data = _make_config_mapping(classes, toggled_list)
-                with open(path, "w", encoding="utf-8") as fh:
-                    json.dump(data, fh, indent=2, ensure_ascii=False)
+                # Presets are meant to be read and shared; keep them indented.
+                payload = storage.dumps(
+                    _make_config_mapping(classes, toggled_list), indent=True
+                )
+            storage.atomic_write_bytes(path, payload)
         except Exception as e:
             self.dialogs.error(self.view, "Export failed", f"Could not export preset:\n{e}")
             return
@@ -453,18 +716,15 @@ class Controller:
             return
 
         try:
-            self.model.replace_all(classes)
-            self.view.set_items(self.model.as_list(), checked=False)
-
-            # Apply toggles in view order for deterministic behavior.
-            for name in self.model.as_list():
-                if name in toggled:
-                    self.view.set_item_checked(name, True)
-
-            self.view.sync_select_all_from_items()
-
-            if self._persist_state():
-                total = len(self.model.as_list())
+            self._last_saved_hash = None
+            self.model.replace_all(classes, trusted=True)
+            ordered = self.model.as_list()
+            with self._bulk():
+                self.view.set_items(ordered, checked=toggled)
+                self._invalidate_view_caches()
+
+                self._persist_state()
+                total = len(ordered)
                 self.view.show_status(
                     f"Imported preset ({total} classes).",
                     kind="success",
@@ -480,50 +740,54 @@ class Controller:
         lower = path.lower()
 
         if lower.endswith(".csv"):
-            import csv
-
-            with open(path, "r", newline="", encoding="utf-8") as fh:
-                rows = list(csv.reader(fh))
-
-            if not rows:
-                raise ValueError("CSV file is empty.")
-
-            header = [h.strip().lower() for h in rows[0]]
             classes: List[str] = []
             toggled: Set[str] = set()
+            seen: Set[str] = set()
 
-            if "class" in header:
-                idx_class = header.index("class")
-                idx_toggle = header.index("toggled") if "toggled" in header else None
-
-                for row in rows[1:]:
-                    if idx_class >= len(row):
-                        continue
-                    name = row[idx_class].strip()
-                    if not name:
-                        continue
-                    classes.append(name)
-
-                    if idx_toggle is not None and idx_toggle < len(row):
-                        flag = row[idx_toggle].strip().lower()
-                        if flag in ("1", "true", "yes", "y"):
-                            toggled.add(name)
-            else:
-                # Fallback: first column of each row
-                for row in rows:
-                    if not row:
-                        continue
-                    name = row[0].strip()
-                    if name:
-                        classes.append(name)
-
-            classes = unique_stripped_strings(classes)
-            toggled &= set(classes)
+            # Stream rows straight from the reader; names are stripped and
+            # de-duplicated (first occurrence keeps its position) as they
+            # are read. A name is toggled if any of its rows toggles it.
+            with open(path, "r", newline="", encoding="utf-8") as fh:
+                reader = csv.reader(fh)
+                first = next(reader, None)
+                if first is None:
+                    raise ValueError("CSV file is empty.")
+
+                header = [h.strip().lower() for h in first]
+
+                if "class" in header:
+                    idx_class = header.index("class")
+                    idx_toggle = header.index("toggled") if "toggled" in header else None
+
+                    for row in reader:
+                        if idx_class >= len(row):
+                            continue
+                        name = row[idx_class].strip()
+                        if not name:
+                            continue
+                        if name not in seen:
+                            seen.add(name)
+                            classes.append(name)
+
+                        if idx_toggle is not None and idx_toggle < len(row):
+                            flag = row[idx_toggle].strip().lower()
+                            if flag in ("1", "true", "yes", "y"):
+                                toggled.add(name)
+                else:
+                    # Fallback: first column of each row, header row included.
+                    for row in itertools.chain([first], reader):
+                        if not row:
+                            continue
+                        name = row[0].strip()
+                        if name and name not in seen:
+                            seen.add(name)
+                            classes.append(name)
+
+            # Toggled names are only ever taken from rows that also added
+            # them to `classes`, so no subset intersection is needed here.
             return classes, toggled
 
         else:
-            import json
-
             with open(path, "r", encoding="utf-8") as fh:
                 data = json.load(fh)
 
@@ -540,32 +804,108 @@ class Controller:
                 raise ValueError("'classes' must be a list of strings.")
 
             classes = unique_stripped_strings(raw_classes)
-            toggled = {x.strip() for x in raw_toggled if isinstance(x, str) and x.strip()}
 
-            # Ensure toggled is a subset of classes
-            toggled &= set(classes)
+            # Strip, drop empties, and keep toggled a subset of classes in
+            # one pass.
+            class_set = set(classes)
+            toggled = {
+                name
+                for name in (x.strip() for x in raw_toggled if isinstance(x, str))
+                if name in class_set
+            }
             return classes, toggled
 
     # -----------------------------------------------------------------------------
     # Persistence
     # -----------------------------------------------------------------------------
 
-    def _persist_state(self) -> bool:
-        """Save the current classes + toggled list to disk."""
+    def _ordered_enabled(self, classes) -> List[str]:
+        """Return the checked class names, in the order of ``classes``.
+
+        ``classes`` comes from the model, so it is already unique and
+        ordered; one hash probe per class is all that is needed.
+        """
+        enabled = self._enabled_names()
+        return [name for name in classes if name in enabled]
+
+    def _enabled_names(self) -> frozenset:
+        """Return the checked class names, scanning the view only when stale."""
+        if self._enabled_cache is None:
+            self._enabled_cache = frozenset(self.view.get_enabled_names())
+        return self._enabled_cache
+
+    def _invalidate_view_caches(self) -> None:
+        """Forget cached view state after rows or check states change."""
+        self._enabled_cache = None
+
+    def _persist_state(self, *, wait: bool = False) -> bool:
+        """Save the current classes + toggled list to disk.
+
+        The payload is handed to the background persist worker. Write
+        errors are always reported to the user by :meth:`_on_persist_saved`.
+        The write is skipped when the payload matches the last one saved
+        (for example a checkbox toggled and toggled back within the
+        debounce window).
+
+        Args:
+            wait: If True, block until the write has finished. Only
+                callers that need the config on disk right away pass True
+                (actions that read it back, and closing the panel); every
+                other save stays asynchronous.
+
+        Returns:
+            bool: False if a waited-for write failed, True otherwise
+            (including when the write was only queued).
+        """
         # Cancel any pending debounced save; this call will perform the write now.
-        self._save_timer.stop()
+        if self._due.pop(DIRTY_SAVE, None) is not None:
+            self._arm_dirty_timer(time.monotonic())
 
-        try:
-            classes = list(self.model.as_list())
-            allowed = set(classes)
-            enabled = unique_stripped_strings(self.view.get_enabled_names())
-            toggled = [name for name in enabled if name in allowed]
+        classes = self.model.as_list()
+        toggled = self._ordered_enabled(classes)
+
+        payload_hash = hash((classes, tuple(toggled)))
+        if payload_hash == self._last_saved_hash:
+            return True
 
-            storage.save(_make_config_mapping(classes, toggled))
+        # Handed to the persist worker; a failed write clears the hash and
+        # is reported by _on_persist_saved.
+        if self._persist_worker.submit(_make_config_mapping(classes, toggled)):
+            # The previous run may still be winding down after quit().
+            self._persist_thread.wait()
+            self._persist_thread.start()
+        self._last_saved_hash = payload_hash
+        self._last_write_ts = time.monotonic()
+        if not wait:
             return True
-        except OSError as e:
-            self.dialogs.error(self.view, "Save Error", f"Could not write config:\n{e}")
-            return False
+
+        ok, _message = self._persist_worker.flush()
+        if not ok:
+            # The error dialog follows through _on_persist_saved.
+            self._last_saved_hash = None
+        return ok
+
+    def _on_persist_saved(self, ok: bool, message: str) -> None:
+        """Report a failed background config write to the user.
+
+        Args:
+            ok: Whether the write succeeded.
+            message: Error text when ``ok`` is False.
+        """
+        if ok:
+            return
+        # Make sure the next save is attempted again.
+        self._last_saved_hash = None
+        self.dialogs.error(self.view, "Save Error", f"Could not write config:\n{message}")
+
+    def _flush_on_close(self) -> None:
+        """Write pending state to disk and join the persist thread.
+
+        Runs on the view's ``closed`` signal, before Qt deletes the closed
+        window, so the thread is never destroyed while it is running.
+        """
+        self._persist_state(wait=True)
+        self._persist_thread.wait()
 
     def _on_reset_defaults_clicked(self) -> None:
         """Reset the list to factory defaults, enable all items, and save."""
@@ -580,10 +920,14 @@ class Controller:
             return
 
         try:
-            self.model.replace_all(defaults.RENDER_INTENSIVE_NODES)
-            self.view.set_items(self.model.as_list(), checked=True)
-            if self._persist_state():
-                total = len(self.model.as_list())
+            self._last_saved_hash = None
+            self.model.replace_all(defaults.RENDER_INTENSIVE_NODES, trusted=True)
+            ordered = self.model.as_list()
+            with self._bulk():
+                self.view.set_items(ordered, checked=True)
+                self._invalidate_view_caches()
+                self._persist_state()
+                total = len(ordered)
                 self.view.show_status(
                     f"Defaults restored ({total} classes).",
                     kind="success",
@@ -593,7 +937,7 @@ class Controller:
         except Exception as exc:
             self._handle_ui_error("resetting the list to defaults", exc)
 
-    def _on_list_reordered(self) -> None:
+    def _on_list_reordered(self, *_args) -> None:
         """Sync model and storage after the user reorders items.
 
         Called when the user reorders rows via drag-and-drop. Copies the
@@ -601,10 +945,11 @@ class Controller:
         new configuration, and schedules a debounced counts refresh.
         """
         try:
-            # View is authoritative for visual order; model mirrors it.
-            self.model.replace_all(self.view.get_all_names())
-            if self._persist_state():
-                self._schedule_refresh()
+            # View is authoritative for visual order; model mirrors it. The
+            # cached enabled set is order-independent, so it stays valid.
+            self.model.replace_all(self.view.get_all_names(), trusted=True)
+            self._persist_state()
+            self._schedule_refresh()
 
         except Exception as exc:
             self._handle_ui_error("reordering the class list", exc)
@@ -15,17 +15,23 @@ except Exception:  # pragma: no cover - depends on host Qt binding
     _YES = QtWidgets.QMessageBox.Yes
     _NO = QtWidgets.QMessageBox.No
 
+# Button set for ask_yes_no(), combined once at import.
+_YES_NO_BUTTONS = _YES | _NO
+
 
 class DialogService:
     """Simple service object for showing standard message dialogs.
 
     The methods provided are intentionally minimal and synchronous:
     they block until the user dismisses the dialog, just like the
-    underlying QMessageBox helpers.
+    underlying QMessageBox helpers. The class holds no state, so the
+    methods are static; they can be called on an instance or the class.
     """
 
+    __slots__ = ()
+
+    @staticmethod
     def info(
-        self,
         parent: Optional[QtWidgets.QWidget],
         title: str,
         text: str,
@@ -39,8 +45,8 @@ class DialogService:
         """
         QtWidgets.QMessageBox.information(parent, title, text)
 
+    @staticmethod
     def warn(
-        self,
         parent: Optional[QtWidgets.QWidget],
         title: str,
         text: str,
@@ -54,8 +60,8 @@ class DialogService:
         """
         QtWidgets.QMessageBox.warning(parent, title, text)
 
+    @staticmethod
     def error(
-        self,
         parent: Optional[QtWidgets.QWidget],
         title: str,
         text: str,
@@ -69,8 +75,8 @@ class DialogService:
         """
         QtWidgets.QMessageBox.critical(parent, title, text)
 
+    @staticmethod
     def ask_yes_no(
-        self,
         parent: Optional[QtWidgets.QWidget],
         title: str,
         text: str,
@@ -94,7 +100,7 @@ class DialogService:
             parent,
             title,
             text,
-            _YES | _NO,
+            _YES_NO_BUTTONS,
             _NO,
         )
         return clicked_button == _YES
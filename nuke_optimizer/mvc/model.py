@@ -2,36 +2,50 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Iterable, Optional
 
+from optimizer.text_utils import unique_stripped_strings, unique_strings
+
 
 class Model:
     """Authoritative, ordered set of class names.
 
-    The model stores class names in two parallel structures:
-
-    * ``_items`` - a list preserving insertion / UI order.
-    * ``_set`` - a set mirroring the same contents for O(1) membership
-      checks.
+    The model stores class names as the keys of a single dict
+    (``_data``), which preserves insertion / UI order and gives O(1)
+    membership checks; the values are unused. Names are interned, so
+    lookups with names that went through the model usually match by
+    identity and repeated names share one string object.
 
     The controller should treat this as the single source of truth for
     the class list while the UI is open.
     """
 
+    __slots__ = ("_data", "_snapshot")
+
     def __init__(self) -> None:
         """Initialize an empty model with no class names."""
-        self._items: list[str] = []
-        self._set: set[str] = set()
+        self._data: dict[str, None] = {}
+        # Cached as_list() result; reset by every mutator.
+        self._snapshot: Optional[tuple[str, ...]] = None
 
     def as_list(self) -> tuple[str, ...]:
         """Return class names as an immutable tuple in UI order.
 
+        The tuple is a snapshot; callers can keep, iterate, or pass it on
+        without copying it again. It is built once and reused until the
+        model changes.
+
         Returns:
             tuple[str, ...]: Current class names in insertion/UI order.
         """
-        return tuple(self._items)
+        if self._snapshot is None:
+            self._snapshot = tuple(self._data)
+        return self._snapshot
 
-    def replace_all(self, list_of_classes: Iterable[str]) -> None:
+    def replace_all(
+        self, list_of_classes: Iterable[str], *, trusted: bool = False
+    ) -> None:
         """Replace all class names with a new ordered collection.
 
         Incoming values are normalized defensively:
@@ -46,23 +60,20 @@ class Model:
 
         Args:
             list_of_classes: Iterable of class names to store.
+            trusted: If True, the values are known to be stripped,
+                non-empty strings (for example names read back from the
+                view), so only duplicates are removed.
         """
-        incoming: list[str] = []
-        seen: set[str] = set()
-        for x in list_of_classes:
-            if not isinstance(x, str):
-                continue
-            name = x.strip()
-            if not name or name in seen:
-                continue
-            seen.add(name)
-            incoming.append(name)
+        if trusted:
+            incoming = tuple(map(sys.intern, unique_strings(list_of_classes)))
+        else:
+            incoming = tuple(map(sys.intern, unique_stripped_strings(list_of_classes)))
 
-        if incoming == self._items:
+        if incoming == self.as_list():
             return
 
-        self._items = incoming
-        self._set = set(incoming)
+        self._data = dict.fromkeys(incoming)
+        self._snapshot = incoming
 
     def add_class(self, name: str) -> tuple[bool, Optional[str]]:
         """Add one class name if valid and not already present.
@@ -78,17 +89,51 @@ class Model:
                 * ``'empty'`` - the trimmed name is empty.
                 * ``'exists'`` - the class name already exists.
         """
-        if not isinstance(name, str):
+        if type(name) is not str:
             return False, "type"
-        n = name.strip()
+        n = sys.intern(name.strip())
         if not n:
             return False, "empty"
-        if n in self._set:
+        if n in self._data:
             return False, "exists"
-        self._items.append(n)
-        self._set.add(n)
+        self._data[n] = None
+        self._snapshot = None
         return True, None
 
+    def add_classes(
+        self, names: Iterable[str]
+    ) -> tuple[list[str], list[tuple[object, str]]]:
+        """Add several class names in one pass.
+
+        Each name is validated exactly like :meth:`add_class`.
+
+        Args:
+            names: Candidate class names, in order.
+
+        Returns:
+            tuple[list[str], list[tuple[object, str]]]: ``(added, skipped)``
+            where ``added`` holds the stripped names that were appended and
+            ``skipped`` holds ``(name, err_code)`` pairs using the error
+            codes of :meth:`add_class`.
+        """
+        added: list[str] = []
+        skipped: list[tuple[object, str]] = []
+        for name in names:
+            if type(name) is not str:
+                skipped.append((name, "type"))
+                continue
+            n = sys.intern(name.strip())
+            if not n:
+                skipped.append((name, "empty"))
+            elif n in self._data:
+                skipped.append((name, "exists"))
+            else:
+                self._data[n] = None
+                added.append(n)
+        if added:
+            self._snapshot = None
+        return added, skipped
+
     def remove_classes(self, list_of_names: Iterable[str]) -> dict[str, object]:
         """Remove any classes whose names appear in ``list_of_names``.
 
@@ -105,13 +150,17 @@ class Model:
                 * ``'changed'``: ``True`` if the model was modified,
                   ``False`` otherwise.
         """
-        targets = {name.strip() for name in list_of_names if isinstance(name, str) and name.strip()}
+        targets = frozenset(
+            name.strip() for name in list_of_names if type(name) is str and name.strip()
+        )
         if not targets:
             return {"removed": 0, "changed": False}
-        remaining_items = [class_name for class_name in self._items if class_name not in targets]
-        removed = len(self._items) - len(remaining_items)
-        if removed == 0:
+        # Only names currently in the model count; a stale selection
+        # returns here without touching the model.
+        hits = targets.intersection(self._data)
+        if not hits:
             return {"removed": 0, "changed": False}
-        self._items = remaining_items
-        self._set = set(remaining_items)
-        return {"removed": removed, "changed": True}
+        for name in hits:
+            del self._data[name]
+        self._snapshot = None
+        return {"removed": len(hits), "changed": True}
@@ -11,59 +11,53 @@ except Exception:  # pragma: no cover - depends on host DCC
     from PySide2 import QtCore, QtGui, QtWidgets  # type: ignore
 
 
-# ItemDataRole.UserRole (Qt6) vs Qt.UserRole (Qt5)
-try:
-    USER_ROLE = QtCore.Qt.ItemDataRole.UserRole  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover
-    USER_ROLE = QtCore.Qt.UserRole  # type: ignore[attr-defined]
+def _qt_enum(scope: str, name: str):
+    """Return ``Qt.<scope>.<name>`` (Qt6) or fall back to ``Qt.<name>`` (Qt5).
 
-# CheckState.Checked (Qt6) vs Qt.Checked (Qt5)
-try:
-    CHECKED = QtCore.Qt.CheckState.Checked  # type: ignore[attr-defined]
-    UNCHECKED = QtCore.Qt.CheckState.Unchecked  # type: ignore[attr-defined]
-    PARTIALLY_CHECKED = QtCore.Qt.CheckState.PartiallyChecked  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover
-    CHECKED = QtCore.Qt.Checked  # type: ignore[attr-defined]
-    UNCHECKED = QtCore.Qt.Unchecked  # type: ignore[attr-defined]
-    PARTIALLY_CHECKED = QtCore.Qt.PartiallyChecked  # type: ignore[attr-defined]
-
-# Item flags (Qt6) vs Qt.ItemIs* (Qt5)
-try:
-    ITEM_IS_ENABLED = QtCore.Qt.ItemFlag.ItemIsEnabled  # type: ignore[attr-defined]
-    ITEM_IS_SELECTABLE = QtCore.Qt.ItemFlag.ItemIsSelectable  # type: ignore[attr-defined]
-    ITEM_IS_USER_CHECKABLE = QtCore.Qt.ItemFlag.ItemIsUserCheckable  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover
-    ITEM_IS_ENABLED = QtCore.Qt.ItemIsEnabled  # type: ignore[attr-defined]
-    ITEM_IS_SELECTABLE = QtCore.Qt.ItemIsSelectable  # type: ignore[attr-defined]
-    ITEM_IS_USER_CHECKABLE = QtCore.Qt.ItemIsUserCheckable  # type: ignore[attr-defined]
-
-# Window hint (Qt6) vs Qt.WindowStaysOnTopHint (Qt5)
-try:
-    WINDOW_STAYS_ON_TOP_HINT = QtCore.Qt.WindowType.WindowStaysOnTopHint  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover
-    WINDOW_STAYS_ON_TOP_HINT = QtCore.Qt.WindowStaysOnTopHint  # type: ignore[attr-defined]
+    Args:
+        scope: Name of the scoped enum type on ``QtCore.Qt`` (for example
+            ``"ItemDataRole"``).
+        name: Name of the enum member.
 
-# Drop action (Qt6) vs Qt.MoveAction (Qt5)
-try:
-    MOVE_ACTION = QtCore.Qt.DropAction.MoveAction  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover
-    MOVE_ACTION = QtCore.Qt.MoveAction  # type: ignore[attr-defined]
+    Returns:
+        The enum value from whichever spelling the binding provides.
+    """
+    value = getattr(getattr(QtCore.Qt, scope, None), name, None)
+    if value is None:  # pragma: no cover - Qt5 bindings
+        value = getattr(QtCore.Qt, name)
+    return value
 
-# Alignment (Qt6) vs Qt.Align* (Qt5)
-try:
-    ALIGN_LEFT = QtCore.Qt.AlignmentFlag.AlignLeft  # type: ignore[attr-defined]
-    ALIGN_RIGHT = QtCore.Qt.AlignmentFlag.AlignRight  # type: ignore[attr-defined]
-    ALIGN_VCENTER = QtCore.Qt.AlignmentFlag.AlignVCenter  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover
-    ALIGN_LEFT = QtCore.Qt.AlignLeft  # type: ignore[attr-defined]
-    ALIGN_RIGHT = QtCore.Qt.AlignRight  # type: ignore[attr-defined]
-    ALIGN_VCENTER = QtCore.Qt.AlignVCenter  # type: ignore[attr-defined]
-
-# Text elide mode (Qt6) vs Qt.ElideRight (Qt5)
-try:
-    ELIDE_RIGHT = QtCore.Qt.TextElideMode.ElideRight  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover
-    ELIDE_RIGHT = QtCore.Qt.ElideRight  # type: ignore[attr-defined]
+
+# Item data roles
+USER_ROLE = _qt_enum("ItemDataRole", "UserRole")
+CHECK_STATE_ROLE = _qt_enum("ItemDataRole", "CheckStateRole")
+
+# Check states
+CHECKED = _qt_enum("CheckState", "Checked")
+UNCHECKED = _qt_enum("CheckState", "Unchecked")
+PARTIALLY_CHECKED = _qt_enum("CheckState", "PartiallyChecked")
+
+# Item flags
+ITEM_IS_ENABLED = _qt_enum("ItemFlag", "ItemIsEnabled")
+ITEM_IS_SELECTABLE = _qt_enum("ItemFlag", "ItemIsSelectable")
+ITEM_IS_USER_CHECKABLE = _qt_enum("ItemFlag", "ItemIsUserCheckable")
+
+# Window hint
+WINDOW_STAYS_ON_TOP_HINT = _qt_enum("WindowType", "WindowStaysOnTopHint")
+
+# Widget attribute
+WA_DELETE_ON_CLOSE = _qt_enum("WidgetAttribute", "WA_DeleteOnClose")
+
+# Drop action
+MOVE_ACTION = _qt_enum("DropAction", "MoveAction")
+
+# Alignment
+ALIGN_LEFT = _qt_enum("AlignmentFlag", "AlignLeft")
+ALIGN_RIGHT = _qt_enum("AlignmentFlag", "AlignRight")
+ALIGN_VCENTER = _qt_enum("AlignmentFlag", "AlignVCenter")
+
+# Text elide mode
+ELIDE_RIGHT = _qt_enum("TextElideMode", "ElideRight")
 
 
 __all__ = [
@@ -71,6 +65,7 @@ __all__ = [
     "QtGui",
     "QtWidgets",
     "USER_ROLE",
+    "CHECK_STATE_ROLE",
     "CHECKED",
     "UNCHECKED",
     "PARTIALLY_CHECKED",
@@ -78,6 +73,7 @@ __all__ = [
     "ITEM_IS_SELECTABLE",
     "ITEM_IS_USER_CHECKABLE",
     "WINDOW_STAYS_ON_TOP_HINT",
+    "WA_DELETE_ON_CLOSE",
     "MOVE_ACTION",
     "ALIGN_LEFT",
     "ALIGN_RIGHT",
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import AbstractSet, Iterable, Optional, Union
 
 from mvc.qt_compat import (
     QtWidgets,
     QtCore,
     QtGui,
     USER_ROLE,
+    CHECK_STATE_ROLE,
     CHECKED,
     UNCHECKED,
     PARTIALLY_CHECKED,
@@ -30,15 +31,43 @@ try:
 except Exception:  # pragma: no cover
     _PLAIN_TEXT = QtCore.Qt.PlainText  # type: ignore[attr-defined]
 
+# QEvent.Type.StyleChange (Qt6) vs QEvent.StyleChange (Qt5)
+try:
+    _STYLE_CHANGE = QtCore.QEvent.Type.StyleChange  # type: ignore[attr-defined]
+except Exception:  # pragma: no cover
+    _STYLE_CHANGE = QtCore.QEvent.StyleChange  # type: ignore[attr-defined]
+
+# Last check state the view has accounted for on each row (bool). Lets
+# itemChanged notifications that did not touch the checkbox be ignored and
+# keeps the checked-row count incremental.
+_LAST_CHECKED_ROLE = USER_ROLE + 3
+
+# Pre-formatted ``'disabled/total disabled'`` suffix, written by
+# View.set_counts() so the delegate does not format it on every paint.
+_SUFFIX_ROLE = USER_ROLE + 4
+
+
+def _count_values(stats: dict[str, dict[str, int]], name: str) -> tuple[int, int, str]:
+    """Return ``(disabled, total, suffix)`` display values for one class.
+
+    Classes missing from ``stats`` count as ``0/0``.
+    """
+    s = stats.get(name, {"total": 0, "disabled": 0})
+    total = int(s.get("total", 0))
+    disabled = int(s.get("disabled", 0))
+    return disabled, total, f"{disabled}/{total} disabled"
+
 
 class CountSuffixDelegate(QtWidgets.QStyledItemDelegate):
     """List item delegate that draws a right-aligned count suffix.
 
     The delegate expects each item to carry:
 
-    - Qt.UserRole       -> base class name (string)
+    - Qt.DisplayRole    -> base class name (string)
+    - Qt.UserRole       -> base class name (fallback when no display text)
     - Qt.UserRole + 1   -> disabled count (int)
     - Qt.UserRole + 2   -> total count (int)
+    - Qt.UserRole + 4   -> pre-formatted count suffix (string)
 
     It renders the base name on the left and a suffix like
     ``'disabled/total disabled'`` on the right, using the standard
@@ -48,6 +77,50 @@ class CountSuffixDelegate(QtWidgets.QStyledItemDelegate):
     # Space (in pixels) between left base text and right suffix.
     GAP = 8
 
+    # Upper bounds on cached suffix widths / elided names before the
+    # respective cache is reset.
+    ADVANCE_CACHE_SIZE = 512
+    ELIDE_CACHE_SIZE = 2048
+
+    def __init__(self, parent=None):
+        """Create the delegate with empty style, font-metrics and text caches.
+
+        Args:
+            parent: Optional parent object (normally the list widget). Its
+                style changes are watched so the cached style is refreshed.
+        """
+        super().__init__(parent)
+        # Style used to paint rows; resolved on first paint and dropped
+        # whenever the parent's style changes (setStyle/setStyleSheet).
+        self._style: Optional[QtWidgets.QStyle] = None
+        if parent is not None:
+            parent.installEventFilter(self)
+        # (font key, suffix) -> horizontal advance in pixels. Suffixes
+        # repeat across rows and repaints, so each is measured once per
+        # font; a font change simply produces new keys.
+        self._advance_cache: dict[tuple[str, str], int] = {}
+        # (font key, base name, available width) -> elided base name. Only
+        # selection/hover usually change between paints, so rows hit this.
+        self._elide_cache: dict[tuple[str, str, int], str] = {}
+        # Font metrics for the last font painted with, rebuilt only when
+        # the font key changes.
+        self._font_key: Optional[str] = None
+        self._font_metrics: Optional[QtGui.QFontMetrics] = None
+
+    def eventFilter(self, watched, event):
+        """Forget the cached style when the watched widget's style changes.
+
+        Args:
+            watched: Object the event was sent to.
+            event: The event being delivered.
+
+        Returns:
+            bool: Always False, so the event is delivered normally.
+        """
+        if event.type() == _STYLE_CHANGE:
+            self._style = None
+        return False
+
     def paint(self, painter, option, index):
         """Paint the base text and count suffix for a list item.
 
@@ -63,28 +136,40 @@ class CountSuffixDelegate(QtWidgets.QStyledItemDelegate):
         """
         style_option = QtWidgets.QStyleOptionViewItem(option)
         self.initStyleOption(style_option, index)
-        style = style_option.widget.style() if style_option.widget else QtWidgets.QApplication.style()
-
-        # Parts from roles (fallback to DisplayRole for base)
-        base = index.data(USER_ROLE) or (style_option.text or "")
-        disabled_count = index.data(USER_ROLE + 1)
-        total_count = index.data(USER_ROLE + 2)
-        suffix = (
-            f"{disabled_count}/{total_count} disabled" if isinstance(disabled_count, int) and isinstance(total_count, int) else ""
-        )
+        style = self._style
+        if style is None:
+            widget = style_option.widget
+            style = widget.style() if widget else QtWidgets.QApplication.style()
+            self._style = style
+
+        # Rows display their class name, which initStyleOption() has already
+        # fetched; only the suffix costs another role read.
+        text_backup = style_option.text
+        base = text_backup or index.data(USER_ROLE) or ""
+        suffix = index.data(_SUFFIX_ROLE) or ""
 
         # Let the style draw background/selection/focus, but not the text
-        text_backup = style_option.text
         style_option.text = ""
         style.drawControl(QtWidgets.QStyle.CE_ItemViewItem, style_option, painter, style_option.widget)
         style_option.text = text_backup
 
         rect = style.subElementRect(QtWidgets.QStyle.SE_ItemViewItemText, style_option, style_option.widget)
-        font_metrics = style_option.fontMetrics
+        font = style_option.font
+        font_key = font.key()
+        if font_key != self._font_key:
+            self._font_metrics = QtGui.QFontMetrics(font)
+            self._font_key = font_key
+        font_metrics = self._font_metrics
 
         # Right rect fits the suffix; left takes the remaining space
         if suffix:
-            right_width = font_metrics.horizontalAdvance(suffix)
+            advance_key = (font_key, suffix)
+            right_width = self._advance_cache.get(advance_key)
+            if right_width is None:
+                if len(self._advance_cache) >= self.ADVANCE_CACHE_SIZE:
+                    self._advance_cache.clear()
+                right_width = font_metrics.horizontalAdvance(suffix)
+                self._advance_cache[advance_key] = right_width
             right_rect = QtCore.QRect(
                 rect.right() - right_width,
                 rect.top(),
@@ -107,38 +192,34 @@ class CountSuffixDelegate(QtWidgets.QStyledItemDelegate):
             left_rect = rect
 
         # Elide the base text so it never overlaps the count suffix.
-        left_text = font_metrics.elidedText(
-            base,
-            ELIDE_RIGHT,
-            max(0, left_rect.width()),
-        )
+        left_width = max(0, left_rect.width())
+        elide_key = (font_key, base, left_width)
+        left_text = self._elide_cache.get(elide_key)
+        if left_text is None:
+            if len(self._elide_cache) >= self.ELIDE_CACHE_SIZE:
+                self._elide_cache.clear()
+            left_text = font_metrics.elidedText(base, ELIDE_RIGHT, left_width)
+            self._elide_cache[elide_key] = left_text
 
-        enabled = bool(style_option.state & QtWidgets.QStyle.State_Enabled)
         role = (
             QtGui.QPalette.HighlightedText
             if (style_option.state & QtWidgets.QStyle.State_Selected)
             else QtGui.QPalette.Text
         )
-
-        style.drawItemText(
-            painter,
-            left_rect,
-            ALIGN_VCENTER | ALIGN_LEFT,
-            style_option.palette,
-            enabled,
-            left_text,
-            role,
-        )
+        if style_option.state & QtWidgets.QStyle.State_Enabled:
+            text_color = style_option.palette.color(role)
+        else:
+            text_color = style_option.palette.color(QtGui.QPalette.Disabled, role)
+
+        # Both strings are already measured/elided and share one color, so
+        # draw them straight onto the painter instead of going through
+        # QStyle.drawItemText() once per string.
+        painter.save()
+        painter.setPen(text_color)
+        painter.drawText(left_rect, ALIGN_VCENTER | ALIGN_LEFT, left_text)
         if suffix:
-            style.drawItemText(
-                painter,
-                right_rect,
-                ALIGN_VCENTER | ALIGN_RIGHT,
-                style_option.palette,
-                enabled,
-                suffix,
-                role,
-            )
+            painter.drawText(right_rect, ALIGN_VCENTER | ALIGN_RIGHT, suffix)
+        painter.restore()
 
 
 class View(QtWidgets.QWidget):
@@ -166,34 +247,50 @@ class View(QtWidgets.QWidget):
         self.create_layout()
         self.set_style()
         self._last_stats: dict[str, dict[str, int]] = {}
+        # Number of rows currently checked; kept in step with every change so
+        # the Select-all checkbox can be synced without scanning rows.
+        self._checked_count = 0
+        # Class name -> row item, for O(1) lookups by name. Row order lives
+        # in the widget, so drag-and-drop reordering leaves this valid.
+        self._index: dict[str, QtWidgets.QListWidgetItem] = {}
+        # Class name -> lower-cased name for the filter. Filled on first
+        # use; the mapping never goes stale, so it is not pruned.
+        self._lower_names: dict[str, str] = {}
 
     # -----------------------------------------------------------------------------
     # Public API (controller calls)
     # -----------------------------------------------------------------------------
 
-    def set_items(self, names: list[str], *, checked: bool = True) -> None:
+    def set_items(
+        self,
+        names: Iterable[str],
+        *,
+        checked: Union[bool, AbstractSet[str]] = True,
+    ) -> None:
         """Replace the entire list with the given class names.
 
-        Clears existing rows, adds one row per name, and applies the same
-        initial checked state to every row. Cached per-class counts are
-        reapplied afterwards.
+        All rows are added in one batch (see :meth:`_append_rows`), which
+        also writes the cached per-class counts, so the rows are walked
+        once. Widget updates are suspended for the whole rebuild, so the
+        list repaints once at the end.
 
         Args:
             names: Class names to show, in row order.
-            checked: Initial checkbox state for every row.
+            checked: Either one checkbox state for every row, or the set of
+                names whose rows start checked (all others start unchecked).
         """
-        # Prevent N itemChanged emissions during bulk rebuild.
-        blocker = QtCore.QSignalBlocker(self.list_widget)
+        self.list_widget.setUpdatesEnabled(False)
         try:
-            self.list_widget.clear()
-            for name in names:
-                self._add_list_item(name, checked=checked)
+            # Prevent itemChanged emissions during the bulk rebuild.
+            with QtCore.QSignalBlocker(self.list_widget):
+                self.list_widget.clear()
+                self._index.clear()
+                self._checked_count = 0
+                self._append_rows(
+                    list(names), checked, stats=self._last_stats or None
+                )
         finally:
-            del blocker
-
-        # Re-apply cached counts so the delegate has its roles again.
-        if self._last_stats:
-            self.set_counts(self._last_stats)
+            self.list_widget.setUpdatesEnabled(True)
 
         # Single, cheap recompute of select-all state.
         self.sync_select_all_from_items()
@@ -211,12 +308,32 @@ class View(QtWidgets.QWidget):
         """
         # Avoid duplicate rows visually; controller/model should
         # also enforce uniqueness.
-        if name in self.get_all_names():
+        if name in self._index:
             return
 
         self._add_list_item(name, checked=checked)
         self.sync_select_all_from_items()
 
+    def add_items(self, names: Iterable[str], *, checked: bool = True) -> None:
+        """Append several items in one batch, skipping names already listed.
+
+        Args:
+            names: Class names to append, in order.
+            checked: Initial checkbox state for the new rows.
+
+        Notes:
+            This only updates the view; the controller is responsible for
+            updating the model and persisting state.
+        """
+        new_names = [name for name in names if name not in self._index]
+        if not new_names:
+            return
+
+        with QtCore.QSignalBlocker(self.list_widget):
+            self._append_rows(new_names, checked)
+
+        self.sync_select_all_from_items()
+
     def remove_selected(self) -> None:
         """Remove the currently selected rows from the list widget.
 
@@ -226,6 +343,9 @@ class View(QtWidgets.QWidget):
             update the underlying model and storage.
         """
         for item in self.list_widget.selectedItems():
+            if item.data(_LAST_CHECKED_ROLE):
+                self._checked_count -= 1
+            self._index.pop(self._base_name(item), None)
             self.list_widget.takeItem(self.list_widget.row(item))
 
         # Keep the Select-all checkbox consistent after removals.
@@ -238,19 +358,80 @@ class View(QtWidgets.QWidget):
             name: Class name to match (exact text match on the row).
             checked: True to check the row; False to uncheck it.
         """
-        blocker = QtCore.QSignalBlocker(self.list_widget)
-        try:
-            for i in range(self.list_widget.count()):
-                item = self.list_widget.item(i)
-                if self._base_name(item) == name:
-                    item.setCheckState(CHECKED if checked else UNCHECKED)
-                    break
-        finally:
-            del blocker
+        item = self._index.get(name)
+        if item is None:
+            return
+
+        with QtCore.QSignalBlocker(self.list_widget):
+            item.setCheckState(CHECKED if checked else UNCHECKED)
+            self._record_checked(item, checked)
 
         # Keep the select-all checkbox consistent with the current item states.
         self.sync_select_all_from_items()
 
+    def set_all_checked(self, state) -> bool:
+        """Apply one check state to every row in a single batched update.
+
+        Rows are written through the list's model with its signals blocked,
+        then a single ``dataChanged`` covering the whole range is emitted so
+        the list repaints once instead of once per row. QListWidget also
+        reports that notification as one ``itemChanged`` (for the first
+        row); callers that listen to it should pause their handler around
+        this call, and sync the Select-all checkbox themselves.
+
+        Nothing is written (and nothing is emitted) when every row already
+        has the requested state.
+
+        Args:
+            state: Qt check state to apply to every row.
+
+        Returns:
+            True if any row changed, False otherwise.
+        """
+        count = self.list_widget.count()
+        target = count if state == CHECKED else 0
+        if self._checked_count == target:
+            return False
+
+        list_model = self.list_widget.model()
+        list_model.blockSignals(True)
+        try:
+            for row in range(count):
+                index = list_model.index(row, 0)
+                list_model.setData(index, state, CHECK_STATE_ROLE)
+                list_model.setData(index, state == CHECKED, _LAST_CHECKED_ROLE)
+        finally:
+            list_model.blockSignals(False)
+        self._checked_count = target
+
+        list_model.dataChanged.emit(
+            list_model.index(0, 0),
+            list_model.index(count - 1, 0),
+            [CHECK_STATE_ROLE],
+        )
+        return True
+
+    def note_item_check_changed(self, item: QtWidgets.QListWidgetItem) -> bool:
+        """Account for a row whose data changed, if its checkbox flipped.
+
+        Called from ``itemChanged``, which Qt also emits for edits that do
+        not touch the checkbox (flags, other roles).
+
+        Args:
+            item: Row reported by ``itemChanged``.
+
+        Returns:
+            True if the row's check state differs from the last recorded
+            one (the checked count is updated), False otherwise.
+        """
+        checked = item.checkState() == CHECKED
+        if item.data(_LAST_CHECKED_ROLE) == checked:
+            return False
+
+        with QtCore.QSignalBlocker(self.list_widget):
+            self._record_checked(item, checked)
+        return True
+
     def get_selected_names(self) -> tuple[str, ...]:
         """Return class names for the currently selected rows."""
         return tuple(self._base_name(it) for it in self.list_widget.selectedItems())
@@ -264,12 +445,9 @@ class View(QtWidgets.QWidget):
 
     def get_enabled_names(self) -> tuple[str, ...]:
         """Return class names for rows whose checkboxes are checked."""
-        out: list[str] = []
-        for i in range(self.list_widget.count()):
-            it = self.list_widget.item(i)
-            if it.checkState() == CHECKED:
-                out.append(self._base_name(it))
-        return tuple(out)
+        item_at = self.list_widget.item
+        rows = (item_at(i) for i in range(self.list_widget.count()))
+        return tuple(it.data(USER_ROLE) for it in rows if it.checkState() == CHECKED)
 
     def sync_select_all_from_items(self) -> None:
         """Synchronize the 'Select all' checkbox with row check states.
@@ -282,19 +460,14 @@ class View(QtWidgets.QWidget):
         """
         total = self.list_widget.count()
 
-        blocker = QtCore.QSignalBlocker(self.chk_select_all)
-        try:
+        with QtCore.QSignalBlocker(self.chk_select_all):
             # No rows -> show unchecked (helps communicate there's
             # nothing to select).
             if total == 0:
                 self.chk_select_all.setCheckState(UNCHECKED)
                 return
 
-            checked = sum(
-                1
-                for i in range(total)
-                if self.list_widget.item(i).checkState() == CHECKED
-            )
+            checked = self._checked_count
 
             if checked == 0:
                 self.chk_select_all.setCheckState(UNCHECKED)
@@ -302,8 +475,6 @@ class View(QtWidgets.QWidget):
                 self.chk_select_all.setCheckState(CHECKED)
             else:
                 self.chk_select_all.setCheckState(PARTIALLY_CHECKED)
-        finally:
-            del blocker
 
     # -----------------------------------------------------------------------------
     # UI construction (widgets + layout + light styling)
@@ -504,22 +675,51 @@ class View(QtWidgets.QWidget):
 
         Notes:
             These values are used only for display; they do not affect
-            the model or Nuke state.
+            the model or Nuke state. Rows are written with the list's
+            model signals blocked and then repainted through a single
+            ``dataChanged`` notification, which is not reported as
+            ``itemChanged``. Rows whose counts are unchanged are skipped.
         """
         self._last_stats = dict(stats)  # cache latest
 
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            name = self._base_name(item)
+        count = self.list_widget.count()
+        if count == 0:
+            return
+
+        # First and last rows that were rewritten.
+        first = last = -1
 
-            # Use defaults when missing.
-            s = stats.get(name, {"total": 0, "disabled": 0})
-            total = int(s.get("total", 0))
-            disabled = int(s.get("disabled", 0))
+        list_model = self.list_widget.model()
+        list_model.blockSignals(True)
+        try:
+            for i in range(count):
+                item = self.list_widget.item(i)
+                disabled, total, suffix = _count_values(stats, self._base_name(item))
+
+                # The suffix encodes both counts, so one read tells
+                # whether the row needs rewriting.
+                if item.data(_SUFFIX_ROLE) == suffix:
+                    continue
+
+                # Roles for the delegate.
+                item.setData(USER_ROLE + 1, disabled)
+                item.setData(USER_ROLE + 2, total)
+                item.setData(_SUFFIX_ROLE, suffix)
+                if first < 0:
+                    first = i
+                last = i
+        finally:
+            list_model.blockSignals(False)
 
-            # Roles for the delegate.
-            item.setData(USER_ROLE + 1, disabled)
-            item.setData(USER_ROLE + 2, total)
+        if first < 0:
+            return
+
+        with QtCore.QSignalBlocker(self.list_widget):
+            list_model.dataChanged.emit(
+                list_model.index(first, 0),
+                list_model.index(last, 0),
+                [USER_ROLE + 1, USER_ROLE + 2, _SUFFIX_ROLE],
+            )
 
     
     def show_status(
@@ -559,10 +759,17 @@ class View(QtWidgets.QWidget):
             text: Substring to match against each row's base name.
         """
         text = text.strip().lower()
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            base = self._base_name(item).lower()
-            item.setHidden(bool(text) and text not in base)
+        if not text:
+            for item in self._index.values():
+                item.setHidden(False)
+            return
+
+        lower_names = self._lower_names
+        for name, item in self._index.items():
+            lowered = lower_names.get(name)
+            if lowered is None:
+                lowered = lower_names[name] = name.lower()
+            item.setHidden(text not in lowered)
 
     def _add_list_item(self, name: str, *, checked: bool) -> None:
         """Create a single list row with a user-checkable checkbox.
@@ -580,8 +787,73 @@ class View(QtWidgets.QWidget):
         )
 
         item.setCheckState(CHECKED if checked else UNCHECKED)
+        item.setData(_LAST_CHECKED_ROLE, bool(checked))
+        self._checked_count += bool(checked)
+        self._index[name] = item
         self.list_widget.addItem(item)
 
+    def _append_rows(
+        self,
+        names: list[str],
+        checked: Union[bool, AbstractSet[str]],
+        *,
+        stats: Optional[dict[str, dict[str, int]]] = None,
+    ) -> None:
+        """Append checkable rows in one batch and update the checked count.
+
+        Rows are inserted in one ``addItems`` call, then their user role,
+        check state, and (if given) count roles are written with the list model's signals blocked
+        and announced with a single ``dataChanged``. Items created by
+        ``addItems`` are already selectable, enabled, and user-checkable,
+        so their flags are left alone. Callers are expected to block the
+        list widget's own signals.
+
+        Args:
+            names: Class names to append, in row order.
+            checked: One checkbox state for every row, or the set of names
+                whose rows start checked.
+            stats: Optional per-class counts (as for :meth:`set_counts`)
+                to write onto the new rows in the same pass.
+        """
+        if not names:
+            return
+
+        first_row = self.list_widget.count()
+        self.list_widget.addItems(names)
+
+        list_model = self.list_widget.model()
+        list_model.blockSignals(True)
+        try:
+            uniform = isinstance(checked, bool)
+            checked_count = 0
+            for row, name in enumerate(names, first_row):
+                state = checked if uniform else name in checked
+                item = self.list_widget.item(row)
+                self._index[name] = item
+                item.setData(USER_ROLE, name)
+                item.setData(_LAST_CHECKED_ROLE, state)
+                item.setCheckState(CHECKED if state else UNCHECKED)
+                checked_count += state
+                if stats is not None:
+                    disabled, total, suffix = _count_values(stats, name)
+                    item.setData(USER_ROLE + 1, disabled)
+                    item.setData(USER_ROLE + 2, total)
+                    item.setData(_SUFFIX_ROLE, suffix)
+            self._checked_count += checked_count
+        finally:
+            list_model.blockSignals(False)
+
+        list_model.dataChanged.emit(
+            list_model.index(first_row, 0),
+            list_model.index(first_row + len(names) - 1, 0),
+        )
+
+    def _record_checked(self, item: QtWidgets.QListWidgetItem, checked: bool) -> None:
+        """Store a row's accounted check state and adjust the checked count."""
+        if bool(item.data(_LAST_CHECKED_ROLE)) != checked:
+            self._checked_count += 1 if checked else -1
+        item.setData(_LAST_CHECKED_ROLE, checked)
+
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """Handle the window close event.
 
@@ -0,0 +1,114 @@
+"""Callables behind the Optimizer entries in Nuke's menu.
+
+``menu.py`` is sourced by Nuke as ``__main__``, so anything it defines
+lands in Nuke's shared script namespace. The menu commands live here
+instead and are registered as bound functions of this module.
+"""
+
+import functools
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+# Menu action name -> callable taking the nuke_services module.
+_ACTIONS = {
+    "toggle": lambda services: services.toggle_heavy_nodes(),
+    "enable": lambda services: services.apply_heavy_nodes("enable"),
+    "disable": lambda services: services.apply_heavy_nodes("disable"),
+}
+
+# nuke_services module, imported on the first action by run_action().
+_SERVICES = None
+
+
+def show_editor():
+    """Open (or raise) the Optimizer editor window."""
+    from mvc import app
+
+    app.show()
+
+
+def toggle_heavy_nodes():
+    """Toggle the disable knob on all heavy nodes (menu command)."""
+    return run_action("toggle")
+
+
+def enable_heavy_nodes():
+    """Enable all heavy nodes (menu command)."""
+    return run_action("enable")
+
+
+def disable_heavy_nodes():
+    """Disable all heavy nodes (menu command)."""
+    return run_action("disable")
+
+
+def run_action(action):
+    """Run a heavy-node action on behalf of a menu command or hotkey.
+
+    The Nuke-facing services are imported on first use only, so
+    registering the menu at startup stays cheap. The outcome is
+    summarized in the Optimizer log.
+
+    Args:
+        action: One of ``'toggle'``, ``'enable'`` or ``'disable'``.
+
+    Returns:
+        dict: Summary dictionary returned by
+        ``nuke_services.apply_heavy_nodes()``, or ``None`` if ``action``
+        is not recognized.
+    """
+    global _SERVICES
+    from mvc import app
+
+    app.ensure_logging()
+
+    if _SERVICES is None:
+        from optimizer import nuke_services
+
+        _SERVICES = nuke_services
+
+    run = _ACTIONS.get(action)
+    if run is None:
+        import nuke
+
+        logger.error("Unknown Optimizer action: %r", action)
+        nuke.message(f"Unknown Optimizer action: {action!r}")
+        return None
+
+    result = run(_SERVICES)
+    logger.info("%s", format_result(result))
+    return result
+
+
+def format_result(result):
+    """Return a one-line summary of a heavy-node action result.
+
+    Args:
+        result: Summary dictionary returned by
+            ``nuke_services.apply_heavy_nodes()``.
+
+    Returns:
+        str: Human-readable summary, e.g. ``'Disabled 3 of 4 heavy nodes.'``.
+    """
+    return _format_tuple(
+        result.get("total", 0),
+        result.get("changed", 0),
+        result.get("action"),
+        result.get("reason"),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _format_tuple(total, changed, action, reason):
+    """Build (and cache) the summary text for :func:`format_result`."""
+    if action == "noop" or total == 0:
+        if reason == "no_active_classes":
+            return "No active classes selected."
+        if reason == "no_matching_nodes":
+            return "No matching nodes found for the active classes."
+        return "No heavy nodes found in the current scene."
+
+    verb = "Disabled" if action == "disabled" else "Enabled"
+    return f"{verb} {changed} of {total} heavy node{'s' if total != 1 else ''}."
@@ -99,44 +99,40 @@ def class_stats(classes: Iterable[str]) -> dict[str, dict[str, int]]:
             }
     """
     nuke = _require_nuke()
-    stats: dict[str, dict[str, int]] = {}
+    stats: dict[str, dict[str, int]] = {
+        class_name: {"total": 0, "disabled": 0} for class_name in classes
+    }
 
     if nuke is None:
-        for class_name in classes:
-            stats[class_name] = {"total": 0, "disabled": 0}
         return stats
 
     # Build once; filter in Python so group recursion remains correct
     # even if nuke.allNodes(filter=..., recurseGroups=True) has quirks
-    # in certain Nuke versions.
-    all_nodes = _iter_all_nodes_global(nuke)
-
-    for class_name in classes:
-        total = 0
-        disabled = 0
+    # in certain Nuke versions. A single pass buckets every node by class,
+    # so the cost is O(nodes) rather than O(classes * nodes).
+    for node in _iter_all_nodes_global(nuke):
+        try:
+            class_name = node.Class()
+        except Exception:
+            continue
 
-        for node in all_nodes:
-            try:
-                if node.Class() != class_name:
-                    continue
-            except Exception:
-                continue
+        entry = stats.get(class_name)
+        if entry is None:
+            continue
 
-            total += 1
-            try:
-                if bool(node["disable"].value()):
-                    disabled += 1
-            except Exception as e:
-                node_name = getattr(node, "name", lambda: "<unnamed>")()
-                logger.debug(
-                    "Ignoring node %s (class %s) for disabled-count: no usable "
-                    "'disable' knob (%s)",
-                    node_name,
-                    class_name,
-                    e,
-                )
-
-        stats[class_name] = {"total": total, "disabled": disabled}
+        entry["total"] += 1
+        try:
+            if bool(node["disable"].value()):
+                entry["disabled"] += 1
+        except Exception as e:
+            node_name = getattr(node, "name", lambda: "<unnamed>")()
+            logger.debug(
+                "Ignoring node %s (class %s) for disabled-count: no usable "
+                "'disable' knob (%s)",
+                node_name,
+                class_name,
+                e,
+            )
 
     return stats
 
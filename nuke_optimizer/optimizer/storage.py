@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
+import os
+import secrets
 from pathlib import Path
-from typing import Any
+from typing import Any, Union
 
 from optimizer import config
 from optimizer.text_utils import unique_stripped_strings
@@ -13,11 +16,81 @@ from optimizer.text_utils import unique_stripped_strings
 
 logger = logging.getLogger(__name__)
 
+# Optional faster JSON encoder; the standard library is used without it.
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on the Nuke Python env
+    orjson = None
+
 
 class StorageError(Exception):
     """Config persistence error."""
 
 
+def dumps(data: Any, *, indent: bool = False) -> bytes:
+    """Encode ``data`` as UTF-8 JSON bytes.
+
+    Uses ``orjson`` when it is installed and the standard library
+    otherwise. Output is compact unless ``indent`` is True, in which case
+    it is indented by two spaces. Non-ASCII characters are kept as-is.
+
+    Args:
+        data: JSON-serializable value.
+        indent: Pretty-print with a two-space indent.
+
+    Returns:
+        bytes: Encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+# Flags for the temp file written by atomic_write_bytes(). It is created
+# with mode 0o666 so the process umask applies exactly as for open().
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Durably replace the file at ``path`` with ``data``.
+
+    The bytes go to a temp file in the same directory, which is flushed and
+    fsynced once and then swapped in with ``os.replace`` (atomic on POSIX
+    and Windows). An interrupted write never leaves a truncated file; on
+    error the temp file is removed. The file mode follows the process
+    umask, as with a plain ``open()``.
+
+    Args:
+        path: Destination file path.
+        data: Complete file contents.
+
+    Raises:
+        OSError: If the file cannot be written or replaced.
+    """
+    path = os.fspath(path)
+    while True:
+        tmp_path = f"{path}.{secrets.token_hex(4)}.tmp"
+        try:
+            fd = os.open(tmp_path, _TMP_FLAGS, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, "wb") as file_handle:
+            file_handle.write(data)
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
 def _canonicalize(data: dict[str, Any]) -> dict[str, Any]:
     """Canonicalize config data in-place and return it.
 
@@ -132,8 +205,12 @@ def save(metadata: dict[str, Any]) -> None:
     - `toggled` is ensured to be a list (defaults to `[]` if missing or of the
       wrong type).
 
-    The normalized mapping is then written as JSON to the path returned by
-    `_config_path()`, creating parent directories as needed.
+    `classes` and `toggled` may be passed as lists or tuples (such as the
+    snapshot returned by ``Model.as_list()``); they are written as lists.
+
+    The normalized mapping is then written as compact JSON (see `dumps()`)
+    to the path returned by `_config_path()`, creating parent directories as
+    needed.
 
     Args:
         metadata: Mapping to write as JSON. Must be a dictionary; otherwise
@@ -151,22 +228,23 @@ def save(metadata: dict[str, Any]) -> None:
     # --- light normalization (add a 'toggled' list if missing)
     if "version" not in metadata:
         metadata["version"] = config.CONFIG_VERSION
-    if "classes" not in metadata or not isinstance(metadata.get("classes"), list):
+    if "classes" not in metadata or not isinstance(metadata.get("classes"), (list, tuple)):
         from optimizer import defaults
 
         metadata["classes"] = list(defaults.RENDER_INTENSIVE_NODES)
     else:
         # Keep only strings; `_canonicalize` will strip, drop empties, and dedupe.
         metadata["classes"] = [x for x in metadata["classes"] if isinstance(x, str)]
-    if "toggled" not in metadata or not isinstance(metadata["toggled"], list):
+    if "toggled" not in metadata or not isinstance(metadata["toggled"], (list, tuple)):
         metadata["toggled"] = []
     else:
         metadata["toggled"] = [x for x in metadata["toggled"] if isinstance(x, str)]
 
     _canonicalize(metadata)
 
-    with config_path.open("w", encoding="utf-8") as file_handle:
-        json.dump(metadata, file_handle, indent=2, ensure_ascii=False)
+    # The config is not meant for hand editing; compact output keeps the
+    # encode step cheap on every debounced save.
+    atomic_write_bytes(config_path, dumps(metadata))
 
 
 def validate(data: dict[str, Any]) -> bool:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
 
 def unique_stripped_strings(values: Any, require_list: bool = False) -> list[str]:
@@ -21,16 +21,24 @@ def unique_stripped_strings(values: Any, require_list: bool = False) -> list[str
     if not values:
         return []
 
-    out: list[str] = []
-    seen: set[str] = set()
+    # Stream stripped names into an insertion-ordered dict: one structure
+    # does both the de-duplication and the ordering.
+    stripped = (item.strip() for item in values if type(item) is str)
+    return list(dict.fromkeys(s for s in stripped if s))
 
-    for item in values:
-        if not isinstance(item, str):
-            continue
-        s = item.strip()
-        if not s or s in seen:
-            continue
-        seen.add(s)
-        out.append(s)
 
-    return out
+def unique_strings(values: Iterable[str]) -> list[str]:
+    """Return ``values`` without duplicates, in first-seen order.
+
+    Fast path for trusted input that is already made of stripped, non-empty
+    strings (for example names read back from the model or the view). The
+    de-duplication runs inside ``dict.fromkeys`` with no per-item checks;
+    use :func:`unique_stripped_strings` for anything user-supplied.
+
+    Args:
+        values: Iterable of already-normalized strings.
+
+    Returns:
+        List of unique strings.
+    """
+    return list(dict.fromkeys(values))